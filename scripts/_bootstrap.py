@@ -0,0 +1,11 @@
+"""
+Put src/ on sys.path so scripts import project packages regardless of cwd.
+
+Usage: `import _bootstrap` before any project import.
+"""
+import sys
+from pathlib import Path
+
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
@@ -5,8 +5,18 @@ Export development process results to various formats
 import sys
 import json
 import argparse
+from datetime import datetime, timezone
 from pathlib import Path
-sys.path.insert(0, "src")
+import _bootstrap  # noqa: F401 - adds src/ to sys.path
+
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def dumps(obj):
+        return json.dumps(obj, indent=2).encode()
 
 from database.models import (
     get_research_result_model, 
@@ -14,80 +24,73 @@ from database.models import (
     get_architecture_model
 )
 
+def fetch_project(research_id):
+    """Fetch research, stories and latest architecture"""
+    # Three indexed local lookups on the shared per-thread connection; a thread pool would
+    # only add a connection (and its pragmas) per worker
+    return (
+        get_research_result_model().get_result_by_job_id(research_id),
+        get_user_story_model().get_stories_by_research(research_id),
+        get_architecture_model().get_latest_architecture(research_id),
+    )
+
 def export_json(research_id, output_file):
     """Export full project data as JSON"""
-    research_model = get_research_result_model()
-    story_model = get_user_story_model()
-    arch_model = get_architecture_model()
-    
-    # Get all data
-    research = research_model.get_result_by_job_id(research_id)
-    stories = story_model.get_stories_by_research(research_id)
-    architecture = arch_model.get_latest_architecture(research_id)
+    research, stories, architecture = fetch_project(research_id)
     
     export_data = {
         "research": research,
         "stories": stories,
         "architecture": architecture,
-        "export_timestamp": "2025-01-30T00:00:00Z"  # Current time would be better
+        "export_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     }
     
-    with open(output_file, 'w') as f:
-        json.dump(export_data, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(dumps(export_data))
     
     print(f"Exported project data to: {output_file}")
 
 def export_markdown(research_id, output_file):
     """Export project documentation as Markdown"""
-    research_model = get_research_result_model()
-    story_model = get_user_story_model()
-    arch_model = get_architecture_model()
+    research, stories, architecture = fetch_project(research_id)
     
-    research = research_model.get_result_by_job_id(research_id)
-    stories = story_model.get_stories_by_research(research_id)
-    architecture = arch_model.get_latest_architecture(research_id)
-    
-    md_content = []
-    
-    if research:
-        md_content.append(f"# {research['research_topic']}")
-        md_content.append("")
-        md_content.append("## Research Overview")
-        md_content.append(research['generated_content'])
-        md_content.append("")
-    
-    if stories:
-        md_content.append("## User Stories")
-        md_content.append("")
-        for story in stories:
-            md_content.append(f"### {story['title']} (Priority: {story['priority']})")
-            md_content.append(story['description'])
-            if story['components']:
-                md_content.append(f"**Components:** {', '.join(story['components'])}")
-            md_content.append("")
-    
-    if architecture:
-        md_content.append("## Architecture")
-        md_content.append("")
-        md_content.append(f"**Changes:** {architecture['changes_summary']}")
-        md_content.append("")
+    with open(output_file, 'w', buffering=1 << 16) as f:
+        w = f.write
+        join = ', '.join
         
-        md_content.append("### Components")
-        for comp in architecture['components']:
-            md_content.append(f"- **{comp['name']}**: {comp['purpose']}")
-            if comp.get('interfaces'):
-                md_content.append(f"  - Interfaces: {', '.join(comp['interfaces'])}")
-            if comp.get('dependencies'):
-                md_content.append(f"  - Dependencies: {', '.join(comp['dependencies'])}")
-        md_content.append("")
+        if research:
+            w(f"# {research['research_topic']}\n\n")
+            w("## Research Overview\n")
+            w(research['generated_content'])
+            w("\n\n")
         
-        if architecture['data_flow']:
-            md_content.append("### Data Flow")
-            for flow in architecture['data_flow']:
-                md_content.append(f"- {flow['from']} → {flow['to']}: {flow['data']}")
-    
-    with open(output_file, 'w') as f:
-        f.write('\n'.join(md_content))
+        if stories:
+            w("## User Stories\n\n")
+            for story in stories:
+                w(f"### {story['title']} (Priority: {story['priority']})\n")
+                w(story['description'])
+                w("\n")
+                if story['components']:
+                    w(f"**Components:** {join(story['components'])}\n")
+                w("\n")
+        
+        if architecture:
+            w("## Architecture\n\n")
+            w(f"**Changes:** {architecture['changes_summary']}\n\n")
+            
+            w("### Components\n")
+            for comp in architecture['components']:
+                w(f"- **{comp['name']}**: {comp['purpose']}\n")
+                if comp.get('interfaces'):
+                    w(f"  - Interfaces: {join(comp['interfaces'])}\n")
+                if comp.get('dependencies'):
+                    w(f"  - Dependencies: {join(comp['dependencies'])}\n")
+            w("\n")
+            
+            if architecture['data_flow']:
+                w("### Data Flow\n")
+                for flow in architecture['data_flow']:
+                    w(f"- {flow['from']} → {flow['to']}: {flow['data']}\n")
     
     print(f"Exported project documentation to: {output_file}")
 
@@ -100,17 +103,12 @@ def export_stories_csv(research_id, output_file):
     with open(output_file, 'w', newline='') as f:
         writer = csv.writer(f)
         writer.writerow(['Story ID', 'Title', 'Description', 'Priority', 'Components', 'Status'])
-        
-        for story in stories:
-            components_str = ', '.join(story['components']) if story['components'] else ''
-            writer.writerow([
-                story['story_id'],
-                story['title'],
-                story['description'],
-                story['priority'],
-                components_str,
-                story['status']
-            ])
+        join = ', '.join
+        writer.writerows(
+            [s['story_id'], s['title'], s['description'], s['priority'],
+             join(s['components']) if s['components'] else '', s['status']]
+            for s in stories
+        )
     
     print(f"Exported {len(stories)} stories to: {output_file}")
 
@@ -3,7 +3,7 @@
 Get research content by ID for backlog processing
 """
 import sys
-sys.path.insert(0, "src")
+import _bootstrap  # noqa: F401 - adds src/ to sys.path
 
 from database.models import get_research_result_model
 
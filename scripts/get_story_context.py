@@ -4,7 +4,7 @@ Get story context for architecture planning
 """
 import sys
 import json
-sys.path.insert(0, "src")
+import _bootstrap  # noqa: F401 - adds src/ to sys.path
 
 from database.models import get_user_story_model, get_research_result_model
 
@@ -18,16 +18,14 @@ def main():
     research_model = get_research_result_model()
     
     # Get story data
-    research_id = story_id.split('_story_')[0]
-    stories = story_model.get_stories_by_research(research_id)
-    story = next((s for s in stories if s['story_id'] == story_id), None)
+    story = story_model.get_story_by_id(story_id)
     
     if not story:
         print(f"No story found for ID: {story_id}", file=sys.stderr)
         sys.exit(1)
     
     # Get research context
-    research = research_model.get_result_by_job_id(research_id)
+    research = research_model.get_result_by_job_id(story['research_id'])
     
     context = {
         "story": story,
@@ -5,13 +5,12 @@ Simple script to handle CLI usage without embedding Python in shell scripts.
 """
 
 import sys
+import json
 import argparse
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import _bootstrap  # noqa: F401 - adds src/ to sys.path
 
-from langchain_integration import LangChainClient
+from langchain_integration import LangChainClient, PromptCache
 
 
 def main():
@@ -25,11 +24,13 @@ def main():
     parser.add_argument("--type", choices=["chat", "architecture"], 
                        default="chat", help="Request type")
     parser.add_argument("--story-id", help="Story ID for architecture planning")
+    parser.add_argument("--cache", action="store_true", help="Reuse cached responses for identical prompts")
     
     args = parser.parse_args()
     
     try:
-        client = LangChainClient(provider=args.provider, model=args.model)
+        cache = PromptCache() if args.cache else None
+        client = LangChainClient(provider=args.provider, model=args.model, cache=cache)
         
         if args.type == "architecture":
             # Get story context for architecture planning
@@ -37,16 +38,14 @@ def main():
                 print("Error: --story-id required for architecture planning", file=sys.stderr)
                 sys.exit(1)
             
-            # Import here to avoid circular imports
-            sys.path.insert(0, "src")
+            # Only architecture planning needs the database layer
             from database.models import get_user_story_model, get_research_result_model
             
             story_model = get_user_story_model()
             research_model = get_research_result_model()
             
             # Get story data
-            stories = story_model.get_stories_by_research(args.story_id.split('_story_')[0])
-            story = next((s for s in stories if s['story_id'] == args.story_id), None)
+            story = story_model.get_story_by_id(args.story_id)
             
             if not story:
                 print(f"Error: Story not found: {args.story_id}", file=sys.stderr)
@@ -61,7 +60,6 @@ def main():
             
             # Plan architecture (current_architecture is empty for now)
             response = client.plan_architecture("", research_content, story_text)
-            import json
             print(json.dumps(response, indent=2))
             
         elif args.format == "json":
@@ -69,7 +67,6 @@ def main():
                 print("Error: prompt required for JSON format", file=sys.stderr)
                 sys.exit(1)
             response = client.split_into_array(args.prompt)
-            import json
             print(json.dumps(response, indent=2))
         else:
             if not args.prompt:
@@ -20,8 +20,7 @@ import logging
 import sys
 from pathlib import Path
 
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+import _bootstrap  # noqa: F401 - adds src/ to sys.path
 
 from state_machine.engine import StateMachineEngine
 
@@ -30,6 +29,11 @@ def setup_logging(debug: bool = False) -> None:
     """Setup logging configuration"""
     level = logging.DEBUG if debug else logging.INFO
     
+    # Skip record attributes the format never shows
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # Create formatter
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -62,7 +66,7 @@ async def run_development_process(config_file: str, debug: bool = False) -> None
     logger = logging.getLogger(__name__)
     
     logger.info("🚀 Starting Development Process State Machine")
-    logger.info(f"📋 Configuration: {config_file}")
+    logger.info("📋 Configuration: %s", config_file)
     
     try:
         # Create and configure state machine
@@ -72,7 +76,7 @@ async def run_development_process(config_file: str, debug: bool = False) -> None
         # Run the state machine with initial context
         initial_context = {
             'process_name': 'Development Process Demo',
-            'start_time': asyncio.get_event_loop().time()
+            'start_time': asyncio.get_running_loop().time()
         }
         
         await engine.execute_state_machine(initial_context)
@@ -80,10 +84,10 @@ async def run_development_process(config_file: str, debug: bool = False) -> None
     except KeyboardInterrupt:
         logger.info("⏹️  Process interrupted by user")
     except FileNotFoundError as e:
-        logger.error(f"❌ Configuration file not found: {e}")
+        logger.error("❌ Configuration file not found: %s", e)
         sys.exit(1)
     except Exception as e:
-        logger.error(f"❌ Error running development process: {e}")
+        logger.error("❌ Error running development process: %s", e)
         if debug:
             logger.exception("Full error details:")
         sys.exit(1)
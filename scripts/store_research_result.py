@@ -7,10 +7,8 @@ Usage: python store_research_result.py <job_id> <topic> <prompt_file> <output_fi
 import sys
 import os
 import json
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+import _bootstrap  # noqa: F401 - adds src/ to sys.path
 
 from database.models import get_research_result_model
 
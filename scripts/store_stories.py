@@ -4,7 +4,7 @@ Store user stories from backlog processing
 """
 import sys
 import json
-sys.path.insert(0, "src")
+import _bootstrap  # noqa: F401 - adds src/ to sys.path
 
 from database.models import get_user_story_model
 
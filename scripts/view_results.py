@@ -6,7 +6,8 @@ import sys
 import json
 import argparse
 from datetime import datetime
-sys.path.insert(0, "src")
+from functools import lru_cache
+import _bootstrap  # noqa: F401 - adds src/ to sys.path
 
 from database.models import (
     get_research_result_model, 
@@ -14,22 +15,30 @@ from database.models import (
     get_architecture_model
 )
 
+@lru_cache(maxsize=256)
 def format_timestamp(ts_str):
     """Format timestamp for display"""
     if not ts_str:
         return "N/A"
+    if ts_str.endswith('Z'):
+        ts_str = ts_str[:-1] + '+00:00'
     try:
-        dt = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
-        return dt.strftime('%Y-%m-%d %H:%M')
-    except:
+        return datetime.fromisoformat(ts_str).strftime('%Y-%m-%d %H:%M')
+    except ValueError:
         return ts_str
 
+def write_json(data):
+    """Write data as one JSON document"""
+    sys.stdout.write(json.dumps(data, default=str) + "\n")
+
 def view_research(args):
     """View research results"""
     model = get_research_result_model()
     
     if args.id:
         result = model.get_result_by_job_id(args.id)
+        if args.json:
+            return write_json(result)
         if result:
             print(f"Research ID: {result['job_id']}")
             print(f"Topic: {result['research_topic']}")
@@ -43,10 +52,14 @@ def view_research(args):
             print(f"No research found for ID: {args.id}")
     else:
         results = model.list_results(limit=args.limit)
-        print(f"{'ID':<20} {'Topic':<30} {'Words':<8} {'Created':<16}")
-        print("-" * 76)
-        for r in results:
-            print(f"{r['job_id']:<20} {r['research_topic'][:28]:<30} {r['word_count']:<8} {format_timestamp(r['completion_timestamp']):<16}")
+        if args.json:
+            return write_json(results)
+        lines = [f"{'ID':<20} {'Topic':<30} {'Words':<8} {'Created':<16}", "-" * 76]
+        lines.extend(
+            f"{r['job_id']:<20} {r['research_topic'][:28]:<30} {r['word_count']:<8} {format_timestamp(r['completion_timestamp']):<16}"
+            for r in results
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def view_stories(args):
     """View user stories"""
@@ -54,16 +67,21 @@ def view_stories(args):
     
     if args.research_id:
         stories = model.get_stories_by_research(args.research_id)
-        print(f"Stories for research: {args.research_id}")
-        print(f"{'Story ID':<25} {'Title':<30} {'Priority':<8} {'Status':<10}")
-        print("-" * 75)
+        if args.json:
+            return write_json(stories)
+        lines = [
+            f"Stories for research: {args.research_id}",
+            f"{'Story ID':<25} {'Title':<30} {'Priority':<8} {'Status':<10}",
+            "-" * 75,
+        ]
         for story in stories:
-            print(f"{story['story_id']:<25} {story['title'][:28]:<30} {story['priority']:<8} {story['status']:<10}")
+            lines.append(f"{story['story_id']:<25} {story['title'][:28]:<30} {story['priority']:<8} {story['status']:<10}")
             if args.verbose:
-                print(f"  Description: {story['description']}")
+                lines.append(f"  Description: {story['description']}")
                 if story['components']:
-                    print(f"  Components: {', '.join(story['components'])}")
-                print()
+                    lines.append(f"  Components: {', '.join(story['components'])}")
+                lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     else:
         print("Use --research-id to view stories for a specific research")
 
@@ -73,6 +91,8 @@ def view_architecture(args):
     
     if args.research_id:
         arch = model.get_latest_architecture(args.research_id)
+        if args.json:
+            return write_json(arch)
         if arch:
             print(f"Latest Architecture for: {args.research_id}")
             print(f"Version ID: {arch['version_id']}")
@@ -104,8 +124,11 @@ def main():
     parser.add_argument("--research-id", help="Research ID for stories/architecture")
     parser.add_argument("--limit", type=int, default=10, help="Limit for list results")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--json", action="store_true", help="Output raw records as JSON")
     
     args = parser.parse_args()
+    if args.json and args.type != "research" and not args.research_id:
+        parser.error(f"--research-id is required for {args.type} --json")
     
     try:
         if args.type == "research":
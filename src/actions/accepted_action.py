@@ -21,6 +21,10 @@ class AcceptedAction(BaseAction):
     - 'accepted' event to transition to completed state
     """
     
+    def __init__(self, action_config: Dict[str, Any]):
+        super().__init__(action_config)
+        self.message = self.get_config_value('message', "Work automatically accepted for demo")
+    
     async def execute(self, context: Dict[str, Any]) -> str:
         """
         Execute acceptance action.
@@ -31,8 +35,6 @@ class AcceptedAction(BaseAction):
         Returns:
             'accepted' event to complete the process
         """
-        message = self.get_config_value('message', "Work automatically accepted for demo")
-        
-        logger.info(f"✅ {message}")
+        logger.info("✅ %s", self.message)
         
         return 'accepted'
\ No newline at end of file
@@ -28,11 +28,57 @@ action:
 
 import asyncio
 import logging
+import os
+import re
+import shlex
+import signal
 from typing import Dict, Any
 from .base import BaseAction
 
 logger = logging.getLogger(__name__)
 
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+# Anything beyond plain words and quoting needs /bin/sh
+_SHELL_SYNTAX = re.compile(r'[|&;<>()$`\\*?\[\]{}~!#\n]')
+
+
+def _quote(value: Any) -> str:
+    """Double-quote file paths and strings with spaces (handles apostrophes in filenames)"""
+    if isinstance(value, str) and ('/' in value or ' ' in value):
+        return f'"{value}"'
+    return str(value)
+
+
+def _fail_job(context: Dict[str, Any], job, label: str) -> None:
+    """Remove job from queue and clear current job, so a failing job is not retried forever"""
+    if job and 'queue' in context and hasattr(context['queue'], 'complete_job'):
+        context['queue'].complete_job(job['id'])
+        logger.info("Removed %s job %s from queue", label, job['id'])
+    context.pop('current_job', None)
+
+
+async def _tail(stream: asyncio.StreamReader, limit: int = 65536) -> bytes:
+    """Drain stream to EOF, keeping only the last `limit` bytes for logging"""
+    buf = bytearray()
+    while chunk := await stream.read(65536):
+        buf += chunk
+        if len(buf) > limit:
+            del buf[:-limit]
+    return bytes(buf)
+
+
+def _argv(command: str):
+    """Split command into argv for direct exec, or None if it needs shell parsing"""
+    if _SHELL_SYNTAX.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or '=' in argv[0]:
+        return None
+    return argv
+
 
 class BashAction(BaseAction):
     """
@@ -49,6 +95,30 @@ class BashAction(BaseAction):
       "2": "file_not_found"     # Exit code 2 → file_not_found event
     """
     
+    def __init__(self, action_config: Dict[str, Any]):
+        super().__init__(action_config)
+        # Config is fixed after load; read it once instead of per execute
+        self.command = self.get_config_value('command')
+        self.timeout = self.get_config_value('timeout', 30)
+        self.description = self.get_config_value('description', 'bash command')
+        self.success_event = self.get_config_value('success', 'job_done')
+        self.error_mappings = self.get_config_value('error_mappings', {})
+        self.recoverable_errors = self.get_config_value('recoverable_errors', ['validation_failed', 'retry_needed'])
+        # Split once into alternating literal / placeholder-name segments
+        self._segments = _PLACEHOLDER.split(self.command) if self.command else None
+    
+    def _render_command(self, job_data: Dict[str, Any]) -> str:
+        """Substitute {param_name} placeholders from job data; unknown names stay literal"""
+        parts = []
+        for i, segment in enumerate(self._segments):
+            if i % 2 == 0:
+                parts.append(segment)
+            elif segment in job_data and segment != 'event':
+                parts.append(_quote(job_data[segment]))
+            else:
+                parts.append(f"{{{segment}}}")
+        return ''.join(parts)
+    
     async def execute(self, context: Dict[str, Any]) -> str:
         """
         Execute bash command and return event based on exit code.
@@ -76,104 +146,96 @@ class BashAction(BaseAction):
         
         # Use config command and substitute parameters from job data
         if not command:
-            command = self.get_config_value('command')
+            command = self.command
             if command and job and isinstance(job.get('data'), dict):
-                job_data = job['data']
-                
-                # Substitute parameters using {param_name} placeholders
-                for key, value in job_data.items():
-                    if key != 'event':  # Skip event field
-                        placeholder = f"{{{key}}}"
-                        if placeholder in command:
-                            # Properly quote file paths and strings with spaces
-                            # Use double quotes to handle apostrophes in filenames
-                            quoted_value = f'"{value}"' if isinstance(value, str) and ('/' in value or ' ' in value) else str(value)
-                            command = command.replace(placeholder, quoted_value)
+                command = self._render_command(job['data'])
             
         if not command:
             logger.error("No command specified in job data or bash action config")
             return 'error'
         
-        timeout = self.get_config_value('timeout', 30)
+        timeout = self.timeout
         job_id = job['id'] if job else 'unknown'
         
         # Only log command details in debug mode - use description for concise info logging
-        description = self.get_config_value('description', 'bash command')
-        logger.info(f"🔧 {description[:50]} (job {job_id})")
-        logger.debug(f"Executing bash command for job {job_id}: {command}")
+        logger.info("🔧 %s (job %s)", self.description[:50], job_id)
+        logger.debug("Executing bash command for job %s: %s", job_id, command)
         
         try:
-            # Execute command with timeout
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            # Execute command with timeout; skip the /bin/sh hop for plain commands
+            process = None
+            argv = _argv(command)
+            if argv:
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        *argv,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        start_new_session=True
+                    )
+                except (FileNotFoundError, PermissionError):
+                    pass  # let the shell report it (exit 127/126) for error mappings
+            if process is None:
+                process = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    start_new_session=True
+                )
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(), 
-                timeout=timeout
-            )
+            try:
+                # Drain both pipes with bounded memory, whatever the output size
+                stdout, stderr, _ = await asyncio.wait_for(
+                    asyncio.gather(_tail(process.stdout), _tail(process.stderr), process.wait()),
+                    timeout=timeout
+                )
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                # Kill the whole process group so script children do not outlive the action
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                await process.wait()
+                raise
             
-            # Log output
-            if stdout:
-                logger.info(f"Command stdout: {stdout.decode().strip()}")
-            if stderr:
-                logger.warning(f"Command stderr: {stderr.decode().strip()}")
+            # Log output; skip decoding when the record would be dropped
+            if stdout and logger.isEnabledFor(logging.INFO):
+                logger.info("Command stdout: %s", stdout.decode("utf-8", "replace").strip())
+            if stderr and logger.isEnabledFor(logging.WARNING):
+                logger.warning("Command stderr: %s", stderr.decode("utf-8", "replace").strip())
             
             # Check exit code
             if process.returncode == 0:
-                logger.info(f"Command completed successfully for job {job_id}")
+                logger.info("Command completed successfully for job %s", job_id)
                 
                 # Return custom success event if specified, otherwise 'job_done'
-                success_event = self.get_config_value('success', 'job_done')
-                return success_event
+                return self.success_event
             else:
-                logger.error(f"Command failed with exit code {process.returncode} for job {job_id}")
+                logger.error("Command failed with exit code %s for job %s", process.returncode, job_id)
                 
                 # Check for error mapping based on exit code
-                error_mappings = self.get_config_value('error_mappings', {})
+                error_mappings = self.error_mappings
                 if str(process.returncode) in error_mappings:
                     mapped_error = error_mappings[str(process.returncode)]
-                    logger.info(f"Mapping exit code {process.returncode} to event: {mapped_error}")
+                    logger.info("Mapping exit code %s to event: %s", process.returncode, mapped_error)
                     
                     # For specific error types, don't auto-remove job
                     # Let the state machine handle it through proper transitions
-                    recoverable_errors = self.get_config_value('recoverable_errors', ['validation_failed', 'retry_needed'])
-                    if mapped_error in recoverable_errors:
+                    if mapped_error in self.recoverable_errors:
                         return mapped_error
                 
                 # For unmapped errors, remove failed job from queue to prevent infinite retries
-                if job and 'queue' in context and hasattr(context['queue'], 'complete_job'):
-                    context['queue'].complete_job(job['id'])
-                    logger.info(f"Removed failed job {job_id} from queue")
-                
-                # Clear current job on error to prevent infinite loops
-                context.pop('current_job', None)
+                _fail_job(context, job, "failed")
                 
                 # Return mapped error event if available, otherwise default 'error'
                 return error_mappings.get(str(process.returncode), 'error')
                 
         except asyncio.TimeoutError:
-            logger.error(f"Command timed out after {timeout} seconds for job {job_id}")
-            
-            # Remove timed-out job from queue
-            if job and 'queue' in context and hasattr(context['queue'], 'complete_job'):
-                context['queue'].complete_job(job['id'])
-                logger.info(f"Removed timed-out job {job_id} from queue")
-            
-            # Clear current job on timeout to prevent infinite loops
-            context.pop('current_job', None)
+            logger.error("Command timed out after %s seconds for job %s", timeout, job_id)
+            _fail_job(context, job, "timed-out")
             return 'error'
             
         except Exception as e:
-            logger.error(f"Command execution failed for job {job_id}: {e}")
-            
-            # Remove failed job from queue
-            if job and 'queue' in context and hasattr(context['queue'], 'complete_job'):
-                context['queue'].complete_job(job['id'])
-                logger.info(f"Removed failed job {job_id} from queue")
-                
-            # Clear current job on exception to prevent infinite loops
-            context.pop('current_job', None)
+            logger.error("Command execution failed for job %s: %s", job_id, e)
+            _fail_job(context, job, "failed")
             return 'error'
\ No newline at end of file
@@ -5,7 +5,9 @@ IMPORTANT: Changes via Change Management, see CLAUDE.md
 
 Replaces check_queue_action.py with database-backed implementation
 """
+import asyncio
 import logging
+import time
 from typing import Dict, Any, Optional
 import sys
 from pathlib import Path
@@ -27,15 +29,21 @@ class CheckDatabaseQueueAction(BaseAction):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.job_model = get_job_model()
+        # Skip polling for this long after finding the queue empty
+        self.empty_ttl = self.get_config_value('empty_ttl', 0.5)
+        self._empty_until = 0.0
     
     async def execute(self, context: Dict[str, Any]) -> str:
-        print("CheckDatabaseQueueAction: Executing")
+        if time.monotonic() < self._empty_until:
+            return ""
+        
+        logger.debug("CheckDatabaseQueueAction: Executing")
         
-        # Get next job directly from JobModel
-        job = self.job_model.get_next_job()
+        # Get next job directly from JobModel (off the event loop; SQLite blocks on I/O)
+        job = await asyncio.to_thread(self.job_model.get_next_job)
         
         if job:
-            print(f"CheckDatabaseQueueAction: Found job {job['job_id']}: {job['user_prompt']}")
+            logger.debug("CheckDatabaseQueueAction: Found job %s: %s", job['job_id'], job['user_prompt'])
             
             # Set up context for bash_action parameter substitution
             # bash_action expects context['current_job']['data'][param_name]
@@ -56,31 +64,13 @@ class CheckDatabaseQueueAction(BaseAction):
             }
             
             # Mark job as completed
-            self.job_model.complete_job(job['job_id'])
-            print(f"CheckDatabaseQueueAction: Marked job {job['job_id']} as completed")
+            await asyncio.to_thread(self.job_model.complete_job, job['job_id'])
+            logger.debug("CheckDatabaseQueueAction: Marked job %s as completed", job['job_id'])
             
             # Return event to trigger state transition to researching
             return "job_added"
         else:
-            print("CheckDatabaseQueueAction: No jobs found")
+            logger.debug("CheckDatabaseQueueAction: No jobs found")
+            self._empty_until = time.monotonic() + self.empty_ttl
             # Return no event (None or empty string) to stay in current state
             return ""
-    
-    def _cleanup_jobs_with_missing_files(self):
-        """Reset processing jobs that reference non-existent files"""
-        try:
-            problem_jobs = self.job_model.get_processing_jobs_with_missing_files()
-            
-            for job in problem_jobs:
-                job_id = job['job_id']
-                input_path = job['input_image_path']
-                reason = f"Input file not found: {input_path}"
-                
-                logger.warning(f"Resetting job {job_id} - {reason}")
-                self.job_model.reset_job_to_pending(job_id, reason)
-                
-            if problem_jobs:
-                logger.info(f"Reset {len(problem_jobs)} jobs with missing input files to pending")
-                
-        except Exception as e:
-            logger.error(f"Error during job cleanup: {e}")
\ No newline at end of file
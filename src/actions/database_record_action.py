@@ -6,14 +6,20 @@ Records each step of the development process to the database for tracking and de
 
 import asyncio
 import logging
+import time
 from typing import Dict, Any
 
+from database.models import get_pipeline_model
 from .base import BaseAction
 
 
 class DatabaseRecordAction(BaseAction):
     """Records development process steps to database"""
     
+    def __init__(self, action_config: Dict[str, Any]):
+        super().__init__(action_config)
+        self.pipeline_model = get_pipeline_model()
+    
     async def execute(self, context: Dict[str, Any]) -> str:
         """
         Record a development process step to the database.
@@ -25,43 +31,34 @@ class DatabaseRecordAction(BaseAction):
             Event name to continue process
         """
         try:
-            # Import here to avoid circular imports
-            import sys
-            from pathlib import Path
-            sys.path.insert(0, str(Path(__file__).parent.parent))
-            
-            from database.models import get_job_model, get_pipeline_model
-            
             step_name = self.get_config_value('step_name', 'unknown_step')
             step_number = self.get_config_value('step_number', 0)
             description = self.get_config_value('description', step_name)
             
             # Create a job ID based on current time if not in context
-            job_id = context.get('process_job_id', f"process_{int(asyncio.get_event_loop().time())}")
+            job_id = context.get('process_job_id', f"process_{int(time.time())}")
             context['process_job_id'] = job_id  # Store for subsequent steps
             
-            # Record to pipeline results
-            pipeline_model = get_pipeline_model()
-            
             # Create metadata about this step
             metadata = {
                 'process_name': context.get('process_name', 'Development Process'),
                 'step_description': description,
-                'timestamp': asyncio.get_event_loop().time()
+                'timestamp': time.time()
             }
             
-            # Record to pipeline results (synchronous call since SQLite is fast)
-            pipeline_model.record_step(
+            # Record to pipeline results off the event loop
+            await asyncio.to_thread(
+                self.pipeline_model.record_step,
                 job_id=job_id,
                 step_name=step_name,
                 step_number=step_number,
                 metadata=metadata
             )
             
-            self.logger.info(f"📊 Recorded step {step_number}: {step_name} to database")
+            self.logger.info("📊 Recorded step %s: %s to database", step_number, step_name)
             
             return self.get_config_value('success_event', 'work_done')
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to record step to database: {e}")
+            self.logger.error("❌ Failed to record step to database: %s", e)
             return self.get_config_value('error_event', 'error')
\ No newline at end of file
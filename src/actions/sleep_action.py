@@ -26,6 +26,12 @@ class SleepAction(BaseAction):
     - 'work_done' event after sleeping
     """
     
+    def __init__(self, action_config: Dict[str, Any]):
+        super().__init__(action_config)
+        self.duration = self.get_config_value('duration', 1)
+        self.description = self.get_description()
+        self.message = self.get_config_value('message', f"Executing {self.description}")
+    
     async def execute(self, context: Dict[str, Any]) -> str:
         """
         Execute sleep action.
@@ -36,13 +42,10 @@ class SleepAction(BaseAction):
         Returns:
             'work_done' event after sleeping
         """
-        duration = self.get_config_value('duration', 1)
-        message = self.get_config_value('message', f"Executing {self.get_description()}")
-        
-        logger.info(f"🛠️  {message}")
-        logger.info(f"💤 Sleeping for {duration} second(s) to simulate work...")
+        logger.info("🛠️  %s", self.message)
+        logger.info("💤 Sleeping for %s second(s) to simulate work...", self.duration)
         
-        await asyncio.sleep(duration)
+        await asyncio.sleep(self.duration)
         
-        logger.info(f"✅ Work completed: {self.get_description()}")
+        logger.info("✅ Work completed: %s", self.description)
         return 'work_done'
\ No newline at end of file
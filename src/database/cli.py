@@ -7,26 +7,44 @@ IMPORTANT: Changes via Change Management, see CLAUDE.md
 Provides database management and querying capabilities
 """
 import argparse
+import os
 import sys
 from pathlib import Path
-from tabulate import tabulate
-import json
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database.models import get_database, get_job_model, get_pipeline_model, get_research_result_model
 
+def _short(s, n):
+    """Truncate s to n chars with '...'; None and short strings pass through"""
+    return s if s is None or len(s) <= n else s[:n] + '...'
+
+# Backslash escapes keep one record per line and one field per tab
+_TSV_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+def _print_rows(headers, rows, fmt='grid'):
+    """Print rows as a tabulate grid, TSV, or JSON lines (one object per row)"""
+    if fmt == 'tsv':
+        sys.stdout.write(''.join('\t'.join('' if v is None else str(v).translate(_TSV_ESCAPES) for v in row) + '\n' for row in rows))
+    elif fmt == 'json':
+        import json
+        sys.stdout.write(''.join(json.dumps(dict(zip(headers, row))) + '\n' for row in rows))
+    else:
+        from tabulate import tabulate
+        print(tabulate(rows, headers=headers, tablefmt='grid'))
+
 def cmd_status(args):
     """Show database status"""
     job_model = get_job_model()
     
     # Count jobs by status
-    total = job_model.count_jobs()
-    pending = job_model.count_jobs('pending')
-    processing = job_model.count_jobs('processing')
-    completed = job_model.count_jobs('completed')
-    failed = job_model.count_jobs('failed')
+    counts = job_model.count_by_status()
+    total = sum(counts.values())
+    pending = counts.get('pending', 0)
+    processing = counts.get('processing', 0)
+    completed = counts.get('completed', 0)
+    failed = counts.get('failed', 0)
     
     print(f"Database Status:")
     print(f"  Total jobs: {total}")
@@ -46,21 +64,16 @@ def cmd_status(args):
 
 def get_pony_flux_status_counts():
     """Get pony-flux job status counts"""
-    from database.models import Database
-    
-    db = Database()
+    db = get_database()
     counts = {'total': 0, 'pending': 0, 'processing': 0, 'completed': 0, 'failed': 0}
     
     try:
         with db._get_connection() as conn:
-            # Total count
-            cursor = conn.execute("SELECT COUNT(*) FROM pony_flux_jobs")
-            counts['total'] = cursor.fetchone()[0]
-            
-            # Status counts
-            for status in ['pending', 'processing', 'completed', 'failed']:
-                cursor = conn.execute("SELECT COUNT(*) FROM pony_flux_jobs WHERE status = ?", (status,))
-                counts[status] = cursor.fetchone()[0]
+            # All status counts in one scan; total is their sum
+            cursor = conn.execute("SELECT status, COUNT(*) AS n FROM pony_flux_jobs GROUP BY status")
+            for row in cursor:
+                counts[row['status']] = row['n']
+                counts['total'] += row['n']
     except Exception as e:
         print(f"Error getting pony-flux counts: {e}")
     
@@ -68,13 +81,17 @@ def get_pony_flux_status_counts():
 
 def cmd_list_pony_flux_jobs(args):
     """List pony-flux jobs"""
-    from database.models import Database
-    
-    db = Database()
+    db = get_database()
     
     try:
         with db._get_connection() as conn:
-            query = "SELECT id, pony_prompt, flux_prompt, status, created_at, updated_at FROM pony_flux_jobs"
+            # Truncate in SQL so full prompts never leave the page cache
+            query = """
+                SELECT id,
+                       CASE WHEN length(pony_prompt) > 25 THEN substr(pony_prompt, 1, 25) || '...' ELSE pony_prompt END AS pony_short,
+                       CASE WHEN length(flux_prompt) > 25 THEN substr(flux_prompt, 1, 25) || '...' ELSE flux_prompt END AS flux_short,
+                       status, substr(created_at, 1, 19) AS created
+                FROM pony_flux_jobs"""
             params = []
             
             if args.status:
@@ -91,29 +108,22 @@ def cmd_list_pony_flux_jobs(args):
             jobs = cursor.fetchall()
         
         if not jobs:
-            print("No pony-flux jobs found")
+            # stdout stays empty (valid JSON lines / TSV) for scripted formats
+            print("No pony-flux jobs found", file=sys.stdout if args.format == 'grid' else sys.stderr)
             return
         
         # Format for table display
         headers = ['ID', 'Status', 'Created', 'Pony Prompt', 'Flux Prompt']
-        rows = []
-        for job in jobs:
-            job_id, pony_prompt, flux_prompt, status, created_at, updated_at = job
-            created = created_at[:19] if created_at else ''
-            pony_short = (pony_prompt[:25] + '...') if pony_prompt and len(pony_prompt) > 25 else pony_prompt
-            flux_short = (flux_prompt[:25] + '...') if flux_prompt and len(flux_prompt) > 25 else flux_prompt
-            rows.append([job_id, status, created, pony_short, flux_short])
+        rows = ([job['id'], job['status'], job['created'] or '', job['pony_short'], job['flux_short']] for job in jobs)
         
-        print(tabulate(rows, headers=headers, tablefmt='grid'))
+        _print_rows(headers, rows, args.format)
         
     except Exception as e:
         print(f"Error listing pony-flux jobs: {e}")
 
 def cmd_pony_flux_details(args):
     """Show detailed pony-flux job information"""
-    from database.models import Database
-    
-    db = Database()
+    db = get_database()
     
     try:
         with db._get_connection() as conn:
@@ -127,41 +137,25 @@ def cmd_pony_flux_details(args):
             print(f"Pony-flux job {args.job_id} not found")
             return
         
-        job_id, pony_prompt, flux_prompt, status, created_at, updated_at, metadata = job
+        job_id = job['id']
         
         print(f"Pony-Flux Job Details: {job_id}")
-        print(f"  Status: {status}")
-        print(f"  Pony Prompt: {pony_prompt}")
-        print(f"  Flux Prompt: {flux_prompt}")
-        print(f"  Created: {created_at}")
-        print(f"  Updated: {updated_at}")
-        if metadata:
-            print(f"  Metadata: {metadata}")
+        print(f"  Status: {job['status']}")
+        print(f"  Pony Prompt: {job['pony_prompt']}")
+        print(f"  Flux Prompt: {job['flux_prompt']}")
+        print(f"  Created: {job['created_at']}")
+        print(f"  Updated: {job['updated_at']}")
+        if job['metadata']:
+            print(f"  Metadata: {job['metadata']}")
         
         # Check for generated files
-        print(f"\nGenerated Files:")
-        from pathlib import Path
-        
-        # Check for pony image
-        pony_file = Path(f"0-generated/{job_id}-pony.png")
-        if pony_file.exists():
-            print(f"  Pony image: {pony_file} ✅")
-        else:
-            print(f"  Pony image: {pony_file} ❌")
-        
-        # Check for scaled image
-        scaled_file = Path(f"0-scaled/{job_id}-pony_upscaled.png")
-        if scaled_file.exists():
-            print(f"  Scaled image: {scaled_file} ✅")
-        else:
-            print(f"  Scaled image: {scaled_file} ❌")
-        
-        # Check for final result
-        final_file = Path(f"6-final/{job_id}-make_this_person_more_attractive.png")
-        if final_file.exists():
-            print(f"  Final result: {final_file} ✅")
-        else:
-            print(f"  Final result: {final_file} ❌")
+        files = [
+            ("Pony image", f"0-generated/{job_id}-pony.png"),
+            ("Scaled image", f"0-scaled/{job_id}-pony_upscaled.png"),
+            ("Final result", f"6-final/{job_id}-make_this_person_more_attractive.png"),
+        ]
+        print("\nGenerated Files:\n" + "\n".join(
+            f"  {label}: {path} {'✅' if os.path.exists(path) else '❌'}" for label, path in files))
             
     except Exception as e:
         print(f"Error getting pony-flux job details: {e}")
@@ -172,19 +166,19 @@ def cmd_list_jobs(args):
     jobs = job_model.list_jobs(status=args.status, limit=args.limit)
     
     if not jobs:
-        print("No jobs found")
+        # stdout stays empty (valid JSON lines / TSV) for scripted formats
+        print("No jobs found", file=sys.stdout if args.format == 'grid' else sys.stderr)
         return
     
     # Format for table display
     headers = ['ID', 'Status', 'Created', 'Image', 'Prompt']
-    rows = []
-    for job in jobs:
-        created = job['created_at'][:19] if job['created_at'] else ''
-        image_path = Path(job['input_image_path']).name if job['input_image_path'] else ''
-        prompt = (job['user_prompt'][:30] + '...') if job['user_prompt'] and len(job['user_prompt']) > 30 else job['user_prompt']
-        rows.append([job['job_id'], job['status'], created, image_path, prompt])
-    
-    print(tabulate(rows, headers=headers, tablefmt='grid'))
+    rows = (
+        [job['job_id'], job['status'], (job['created_at'] or '')[:19],
+         Path(job['input_image_path']).name if job['input_image_path'] else '', _short(job['user_prompt'], 30)]
+        for job in jobs
+    )
+    
+    _print_rows(headers, rows, args.format)
 
 def cmd_job_details(args):
     """Show detailed job information"""
@@ -226,6 +220,7 @@ def cmd_job_details(args):
 
 def cmd_migrate_queue(args):
     """Migrate existing queue.json to database"""
+    import json
     job_model = get_job_model()
     queue_file = Path("data/queue.json")
     
@@ -237,19 +232,13 @@ def cmd_migrate_queue(args):
         with open(queue_file) as f:
             queue_data = json.load(f)
         
-        migrated = 0
-        for item in queue_data.get('jobs', []):
-            job_id = item.get('id')
-            if job_id and 'input_image' in item:
-                # Check if already exists
-                existing = job_model.get_job(job_id)
-                if not existing:
-                    job_model.create_job(
-                        job_id=job_id,
-                        input_image_path=item['input_image'],
-                        user_prompt=item.get('user_prompt', 'make this person more attractive')
-                    )
-                    migrated += 1
+        jobs = [
+            {'job_id': item['id'], 'input_image_path': item['input_image'],
+             'user_prompt': item.get('user_prompt', 'make this person more attractive')}
+            for item in queue_data.get('jobs', [])
+            if item.get('id') and 'input_image' in item
+        ]
+        migrated = job_model.bulk_create(jobs)
         
         print(f"Migrated {migrated} jobs from queue.json to database")
         
@@ -266,16 +255,15 @@ def cmd_cleanup(args):
     job_model = get_job_model()
     
     if args.status:
-        # Clean up specific status
-        jobs = job_model.list_jobs(status=args.status, limit=1000)
-        if jobs:
-            with job_model.db._get_connection() as conn:
-                job_ids = [job['job_id'] for job in jobs]
-                placeholders = ','.join(['?' for _ in job_ids])
-                conn.execute(f"DELETE FROM pipeline_results WHERE job_id IN ({placeholders})", job_ids)
-                conn.execute(f"DELETE FROM jobs WHERE job_id IN ({placeholders})", job_ids)
-                conn.commit()
-            print(f"Cleaned up {len(jobs)} jobs with status '{args.status}'")
+        # Clean up specific status; results first, while the job rows still match
+        with job_model.db._get_connection() as conn:
+            conn.execute("""
+                DELETE FROM pipeline_results
+                WHERE job_id IN (SELECT job_id FROM jobs WHERE status = ?)
+            """, (args.status,))
+            deleted = conn.execute("DELETE FROM jobs WHERE status = ?", (args.status,)).rowcount
+        if deleted:
+            print(f"Cleaned up {deleted} jobs with status '{args.status}'")
         else:
             print(f"No jobs found with status '{args.status}'")
     else:
@@ -283,59 +271,29 @@ def cmd_cleanup(args):
 
 def cmd_cleanup_pony(args):
     """Clean up pony-flux jobs"""
-    from database.models import Database
+    db = get_database()
+    
+    # Optional status filter shared by all three deletes
+    where, params = ("WHERE status = ?", (args.status,)) if args.status else ("", ())
     
-    db = Database()
+    with db._get_connection() as conn:
+        # Related records in other tables first, while the pony rows still match
+        conn.execute(f"DELETE FROM pipeline_results WHERE job_id IN (SELECT id FROM pony_flux_jobs {where})", params)
+        conn.execute(f"DELETE FROM jobs WHERE job_id IN (SELECT id FROM pony_flux_jobs {where})", params)
+        deleted = conn.execute(f"DELETE FROM pony_flux_jobs {where}", params).rowcount
     
     if args.status:
-        # Clean up pony-flux jobs with specific status
-        with db._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM pony_flux_jobs WHERE status = ?", (args.status,))
-            pony_jobs = cursor.fetchall()
-            
-            if pony_jobs:
-                job_ids = [job[0] for job in pony_jobs]
-                placeholders = ','.join(['?' for _ in job_ids])
-                
-                # Delete from pony_flux_jobs table
-                cursor.execute(f"DELETE FROM pony_flux_jobs WHERE id IN ({placeholders})", job_ids)
-                
-                # Also clean up any related records in other tables
-                cursor.execute(f"DELETE FROM pipeline_results WHERE job_id IN ({placeholders})", job_ids)
-                cursor.execute(f"DELETE FROM jobs WHERE job_id IN ({placeholders})", job_ids)
-                
-                conn.commit()
-                print(f"Cleaned up {len(job_ids)} pony-flux jobs with status '{args.status}'")
-            else:
-                print(f"No pony-flux jobs found with status '{args.status}'")
+        if deleted:
+            print(f"Cleaned up {deleted} pony-flux jobs with status '{args.status}'")
+        else:
+            print(f"No pony-flux jobs found with status '{args.status}'")
+    elif deleted:
+        print(f"Cleaned up {deleted} pony-flux jobs")
     else:
-        # Clean up all pony-flux jobs
-        with db._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM pony_flux_jobs")
-            pony_jobs = cursor.fetchall()
-            
-            if pony_jobs:
-                job_ids = [job[0] for job in pony_jobs]
-                placeholders = ','.join(['?' for _ in job_ids])
-                
-                # Delete from pony_flux_jobs table
-                cursor.execute(f"DELETE FROM pony_flux_jobs WHERE id IN ({placeholders})", job_ids)
-                
-                # Also clean up any related records in other tables
-                cursor.execute(f"DELETE FROM pipeline_results WHERE job_id IN ({placeholders})", job_ids)
-                cursor.execute(f"DELETE FROM jobs WHERE job_id IN ({placeholders})", job_ids)
-                
-                conn.commit()
-                print(f"Cleaned up {len(job_ids)} pony-flux jobs")
-            else:
-                print("No pony-flux jobs found")
+        print("No pony-flux jobs found")
 
 def cmd_add_job(args):
     """Add a new job to the database"""
-    import os
-    
     # Validate input file exists
     if not os.path.exists(args.input_image):
         print(f"Error: Input image not found: {args.input_image}")
@@ -406,33 +364,20 @@ def cmd_add_research_job(args):
 
 def cmd_update_pony_flux_status(args):
     """Update pony-flux job status"""
-    from database.models import Database
-    
-    db = Database()
+    db = get_database()
     
     try:
         with db._get_connection() as conn:
-            # Check if job exists
-            cursor = conn.execute("SELECT id FROM pony_flux_jobs WHERE id = ?", (args.job_id,))
-            if not cursor.fetchone():
-                print(f"Pony-flux job {args.job_id} not found")
-                return 1
-            
-            # Update status and completed timestamp
-            if args.status == 'completed':
-                conn.execute("""
-                    UPDATE pony_flux_jobs 
-                    SET status = ?, updated_at = CURRENT_TIMESTAMP 
-                    WHERE id = ?
-                """, (args.status, args.job_id))
-            else:
-                conn.execute("""
-                    UPDATE pony_flux_jobs 
-                    SET status = ?, updated_at = CURRENT_TIMESTAMP 
-                    WHERE id = ?
-                """, (args.status, args.job_id))
-            
-            conn.commit()
+            # rowcount doubles as the existence check
+            cursor = conn.execute("""
+                UPDATE pony_flux_jobs 
+                SET status = ?, updated_at = CURRENT_TIMESTAMP 
+                WHERE id = ?
+            """, (args.status, args.job_id))
+        
+        if cursor.rowcount == 0:
+            print(f"Pony-flux job {args.job_id} not found")
+            return 1
         
         print(f"✅ Updated pony-flux job {args.job_id} status to '{args.status}'")
         return 0
@@ -443,20 +388,17 @@ def cmd_update_pony_flux_status(args):
 def cmd_remove_job(args):
     """Remove a job from the database"""
     job_model = get_job_model()
-    pipeline_model = get_pipeline_model()
-    
-    # Check if job exists
-    job = job_model.get_job(args.job_id)
-    if not job:
-        print(f"Job {args.job_id} not found")
-        return 1
     
     try:
-        # Remove pipeline results first
+        # rowcount doubles as the existence check; results go in the same transaction
         with job_model.db._get_connection() as conn:
-            conn.execute("DELETE FROM pipeline_results WHERE job_id = ?", (args.job_id,))
-            conn.execute("DELETE FROM jobs WHERE job_id = ?", (args.job_id,))
-            conn.commit()
+            deleted = conn.execute("DELETE FROM jobs WHERE job_id = ?", (args.job_id,)).rowcount
+            if deleted:
+                conn.execute("DELETE FROM pipeline_results WHERE job_id = ?", (args.job_id,))
+        
+        if not deleted:
+            print(f"Job {args.job_id} not found")
+            return 1
         
         print(f"✅ Job {args.job_id} removed successfully!")
         print(f"   Reason: {args.reason or 'No reason specified'}")
@@ -476,19 +418,13 @@ def cmd_list_research(args):
     
     # Format for table display
     headers = ['Job ID', 'Topic', 'Words', 'Model', 'Completed']
-    rows = []
-    for result in results:
-        topic_short = (result['research_topic'][:40] + '...') if result['research_topic'] and len(result['research_topic']) > 40 else result['research_topic']
-        completed = result['completion_timestamp'][:19] if result['completion_timestamp'] else ''
-        rows.append([
-            result['job_id'], 
-            topic_short, 
-            result['word_count'], 
-            result['llm_model'] or 'unknown',
-            completed
-        ])
-    
-    print(tabulate(rows, headers=headers, tablefmt='grid'))
+    rows = (
+        [result['job_id'], _short(result['research_topic'], 40), result['word_count'],
+         result['llm_model'] or 'unknown', (result['completion_timestamp'] or '')[:19]]
+        for result in results
+    )
+    
+    _print_rows(headers, rows)
 
 def cmd_show_research(args):
     """Show detailed research result"""
@@ -559,18 +495,32 @@ def cmd_search_research(args):
     
     print(f"🔍 Search results for '{args.term}':")
     headers = ['Job ID', 'Topic', 'Words', 'Completed']
-    rows = []
-    for result in results:
-        topic_short = (result['research_topic'][:50] + '...') if result['research_topic'] and len(result['research_topic']) > 50 else result['research_topic']
-        completed = result['completion_timestamp'][:19] if result['completion_timestamp'] else ''
-        rows.append([
-            result['job_id'], 
-            topic_short, 
-            result['word_count'], 
-            completed
-        ])
-    
-    print(tabulate(rows, headers=headers, tablefmt='grid'))
+    rows = (
+        [result['job_id'], _short(result['research_topic'], 50), result['word_count'],
+         (result['completion_timestamp'] or '')[:19]]
+        for result in results
+    )
+    
+    _print_rows(headers, rows)
+
+COMMANDS = {
+    'status': cmd_status,
+    'list': cmd_list_jobs,
+    'list-pony-flux': cmd_list_pony_flux_jobs,
+    'details': cmd_job_details,
+    'pony-flux-details': cmd_pony_flux_details,
+    'migrate': cmd_migrate_queue,
+    'cleanup': cmd_cleanup,
+    'cleanup-pony': cmd_cleanup_pony,
+    'add-job': cmd_add_job,
+    'add-research': cmd_add_research_job,
+    'remove-job': cmd_remove_job,
+    'update-pony-flux-status': cmd_update_pony_flux_status,
+    'list-research': cmd_list_research,
+    'show-research': cmd_show_research,
+    'export-research': cmd_export_research,
+    'search-research': cmd_search_research,
+}
 
 def main():
     parser = argparse.ArgumentParser(description="Database CLI for face-changer pipeline")
@@ -584,12 +534,14 @@ def main():
     list_parser.add_argument('--status', choices=['pending', 'processing', 'completed', 'failed'],
                            help='Filter by status')
     list_parser.add_argument('--limit', type=int, default=20, help='Limit number of results')
+    list_parser.add_argument('--format', choices=['grid', 'json', 'tsv'], default='grid', help='Output format')
     
     # List pony-flux jobs command
     list_pf_parser = subparsers.add_parser('list-pony-flux', help='List pony-flux jobs')
     list_pf_parser.add_argument('--status', choices=['pending', 'processing', 'completed', 'failed'],
                                help='Filter by status')
     list_pf_parser.add_argument('--limit', type=int, default=20, help='Limit number of results')
+    list_pf_parser.add_argument('--format', choices=['grid', 'json', 'tsv'], default='grid', help='Output format')
     
     # Job details command
     details_parser = subparsers.add_parser('details', help='Show job details')
@@ -652,7 +604,7 @@ def main():
     export_research_parser.add_argument('--output', help='Output file path (auto-generated if not specified)')
     
     search_research_parser = subparsers.add_parser('search-research', help='Search research results')
-    search_research_parser.add_argument('term', help='Search term to look for in topics or content')
+    search_research_parser.add_argument('term', help='Words to match (by prefix) in topics or content; substring match if no word matches')
     search_research_parser.add_argument('--limit', type=int, default=20, help='Limit number of results')
     
     args = parser.parse_args()
@@ -662,38 +614,7 @@ def main():
         return
     
     try:
-        if args.command == 'status':
-            cmd_status(args)
-        elif args.command == 'list':
-            cmd_list_jobs(args)
-        elif args.command == 'list-pony-flux':
-            cmd_list_pony_flux_jobs(args)
-        elif args.command == 'details':
-            cmd_job_details(args)
-        elif args.command == 'pony-flux-details':
-            cmd_pony_flux_details(args)
-        elif args.command == 'migrate':
-            cmd_migrate_queue(args)
-        elif args.command == 'cleanup':
-            cmd_cleanup(args)
-        elif args.command == 'cleanup-pony':
-            cmd_cleanup_pony(args)
-        elif args.command == 'add-job':
-            return cmd_add_job(args)
-        elif args.command == 'add-research':
-            return cmd_add_research_job(args)
-        elif args.command == 'remove-job':
-            return cmd_remove_job(args)
-        elif args.command == 'update-pony-flux-status':
-            return cmd_update_pony_flux_status(args)
-        elif args.command == 'list-research':
-            cmd_list_research(args)
-        elif args.command == 'show-research':
-            return cmd_show_research(args)
-        elif args.command == 'export-research':
-            return cmd_export_research(args)
-        elif args.command == 'search-research':
-            cmd_search_research(args)
+        return COMMANDS[args.command](args)
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
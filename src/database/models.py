@@ -4,31 +4,49 @@ Database models for face-changer pipeline
 IMPORTANT: Changes via Change Management, see CLAUDE.md
 """
 import sqlite3
+import threading
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, List, Any
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Repo-root data/, so scripts find the same database from any cwd
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "pipeline.db"
+
 class Database:
     """SQLite database manager for face-changer pipeline"""
     
-    def __init__(self, db_path: str = "data/pipeline.db"):
+    def __init__(self, db_path: str = str(DEFAULT_DB_PATH)):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True)
+        self._local = threading.local()
         self._ensure_tables()
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's database connection with row factory, opened on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            # Safe with WAL: commits no longer fsync the main database file
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Per-connection settings; cheap now that connections are reused
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            self._local.conn = conn
         return conn
     
     def _ensure_tables(self):
         """Create database tables if they don't exist"""
         with self._get_connection() as conn:
+            # WAL is persistent in the file: readers no longer block the writer
+            conn.execute("PRAGMA journal_mode=WAL")
+            
             # Jobs table - replaces data/queue.json
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS jobs (
@@ -133,6 +151,8 @@ class Database:
             # Create indexes for better query performance
             conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (created_at)")
+            # get_next_job: seek by status, already ordered by created_at
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_results_job ON pipeline_results (job_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_state_job ON pipeline_state (job_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_state_base ON pipeline_state (job_id, base_filename)")
@@ -143,7 +163,49 @@ class Database:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_arch_story ON architecture_versions (story_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_arch_research ON architecture_versions (research_id)")
             
+            # pony_flux_jobs is created outside this module; index it only when present
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'pony_flux_jobs'").fetchone():
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_pfj_status_created ON pony_flux_jobs (status, created_at)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_pfj_created ON pony_flux_jobs (created_at)")
+            
+            self.has_fts = self._ensure_research_fts(conn)
+            
             conn.commit()
+            # Refresh planner statistics where stale so new indexes get picked
+            conn.execute("PRAGMA optimize")
+
+    def _ensure_research_fts(self, conn: sqlite3.Connection) -> bool:
+        """Full-text index over research topic/content, kept in sync by triggers. False if FTS5 is unavailable"""
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'research_results_fts'").fetchone()
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS research_results_fts
+                USING fts5(research_topic, generated_content, content='research_results', content_rowid='id')
+            """)
+        except sqlite3.OperationalError:
+            return False
+        conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS research_results_ai AFTER INSERT ON research_results BEGIN
+                INSERT INTO research_results_fts (rowid, research_topic, generated_content)
+                VALUES (new.id, new.research_topic, new.generated_content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS research_results_ad AFTER DELETE ON research_results BEGIN
+                INSERT INTO research_results_fts (research_results_fts, rowid, research_topic, generated_content)
+                VALUES ('delete', old.id, old.research_topic, old.generated_content);
+            END;
+            DROP TRIGGER IF EXISTS research_results_au;
+            CREATE TRIGGER IF NOT EXISTS research_results_au_text
+            AFTER UPDATE OF research_topic, generated_content ON research_results BEGIN
+                INSERT INTO research_results_fts (research_results_fts, rowid, research_topic, generated_content)
+                VALUES ('delete', old.id, old.research_topic, old.generated_content);
+                INSERT INTO research_results_fts (rowid, research_topic, generated_content)
+                VALUES (new.id, new.research_topic, new.generated_content);
+            END;
+        """)
+        if not exists:
+            # Index rows stored before the FTS table existed
+            conn.execute("INSERT INTO research_results_fts (research_results_fts) VALUES ('rebuild')")
+        return True
 
 class JobModel:
     """Model for job management"""
@@ -164,6 +226,19 @@ class JobModel:
             """, (job_id, input_image_path, user_prompt, padding_factor, mask_padding_factor))
             return cursor.lastrowid
     
+    def bulk_create(self, jobs: List[Dict[str, Any]]) -> int:
+        """Create many jobs in one transaction, skipping existing job IDs. Returns inserted count"""
+        defaults = {'user_prompt': "make this person more attractive",
+                    'padding_factor': 1.5, 'mask_padding_factor': 1.2}
+        with self.db._get_connection() as conn:
+            cursor = conn.executemany("""
+                INSERT OR IGNORE INTO jobs (job_id, input_image_path, user_prompt,
+                                          padding_factor, mask_padding_factor)
+                VALUES (:job_id, :input_image_path, :user_prompt,
+                        :padding_factor, :mask_padding_factor)
+            """, [{**defaults, **job} for job in jobs])
+            return cursor.rowcount
+    
     def get_next_job(self) -> Optional[Dict[str, Any]]:
         """Get next pending job (replaces queue.get())"""
         with self.db._get_connection() as conn:
@@ -234,33 +309,11 @@ class JobModel:
             else:
                 return conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
     
-    def reset_job_to_pending(self, job_id: str, reason: str = "Reset to pending"):
-        """Reset a specific job from processing back to pending"""
-        with self.db._get_connection() as conn:
-            conn.execute("""
-                UPDATE jobs 
-                SET status = 'pending', started_at = NULL, error_message = ?
-                WHERE job_id = ? AND status = 'processing'
-            """, (reason, job_id))
-            conn.commit()
-            logger.info(f"Reset job {job_id} to pending: {reason}")
-    
-    def get_processing_jobs_with_missing_files(self) -> List[Dict[str, Any]]:
-        """Find processing jobs that reference non-existent input files"""
+    def count_by_status(self) -> Dict[str, int]:
+        """Count jobs grouped by status in a single query"""
         with self.db._get_connection() as conn:
-            rows = conn.execute("""
-                SELECT * FROM jobs WHERE status = 'processing'
-                ORDER BY started_at
-            """).fetchall()
-            
-            problem_jobs = []
-            for row in rows:
-                job_dict = dict(row)
-                input_path = Path(job_dict['input_image_path'])
-                if not input_path.exists():
-                    problem_jobs.append(job_dict)
-            
-            return problem_jobs
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+            return {row[0]: row[1] for row in rows}
 
 class PipelineResultModel:
     """Model for pipeline step results"""
@@ -344,10 +397,12 @@ def get_database() -> Database:
         _db_instance = Database()
     return _db_instance
 
+@lru_cache(maxsize=1)
 def get_job_model() -> JobModel:
     """Get job model instance"""
     return JobModel(get_database())
 
+@lru_cache(maxsize=1)
 def get_pipeline_model() -> PipelineResultModel:
     """Get pipeline result model instance"""
     return PipelineResultModel(get_database())
@@ -514,8 +569,23 @@ class ResearchResultModel:
             return cursor.rowcount > 0
     
     def search_results(self, search_term: str, limit: int = 20) -> List[Dict[str, Any]]:
-        """Search research results by topic or content"""
-        with self.db._get_connection() as conn:
+        """Search research results by topic or content; word-prefix match via FTS5, substring LIKE if that finds nothing"""
+        with self.db._get_connection() as conn:
+            if self.db.has_fts:
+                # Term as one quoted phrase, last word prefix-matched
+                phrase = '"' + search_term.replace('"', '""') + '"*'
+                try:
+                    rows = conn.execute("""
+                        SELECT r.id, r.job_id, r.research_topic, r.word_count, r.completion_timestamp, r.llm_model
+                        FROM research_results_fts f JOIN research_results r ON r.id = f.rowid
+                        WHERE research_results_fts MATCH ?
+                        ORDER BY r.completion_timestamp DESC 
+                        LIMIT ?
+                    """, (phrase, limit)).fetchall()
+                    if rows:
+                        return [dict(row) for row in rows]
+                except sqlite3.OperationalError:
+                    pass  # term has no indexable tokens; fall back to LIKE
             rows = conn.execute("""
                 SELECT id, job_id, research_topic, word_count, completion_timestamp, llm_model
                 FROM research_results 
@@ -525,10 +595,12 @@ class ResearchResultModel:
             """, (f"%{search_term}%", f"%{search_term}%", limit)).fetchall()
             return [dict(row) for row in rows]
 
+@lru_cache(maxsize=1)
 def get_pipeline_state_model() -> PipelineStateModel:
     """Get pipeline state model instance"""
     return PipelineStateModel(get_database())
 
+@lru_cache(maxsize=1)
 def get_research_result_model() -> ResearchResultModel:
     """Get research result model instance"""
     return ResearchResultModel(get_database())
@@ -541,23 +613,23 @@ class UserStoryModel:
     
     def create_stories(self, research_id: str, stories: List[Dict[str, Any]]) -> List[str]:
         """Create multiple user stories from backlog splitting"""
-        story_ids = []
-        with self.db._get_connection() as conn:
-            for i, story in enumerate(stories):
-                story_id = f"{research_id}_story_{i+1}"
-                conn.execute("""
-                    INSERT INTO user_stories 
-                    (story_id, research_id, title, description, priority, components)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    story_id, research_id, 
-                    story['title'], story['description'], 
-                    story.get('priority', 'medium'),
-                    json.dumps(story.get('components', []))
-                ))
-                story_ids.append(story_id)
+        rows = [
+            (
+                f"{research_id}_story_{i+1}", research_id,
+                story['title'], story['description'],
+                story.get('priority', 'medium'),
+                json.dumps(story.get('components', []))
+            )
+            for i, story in enumerate(stories)
+        ]
+        with self.db._get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO user_stories 
+                (story_id, research_id, title, description, priority, components)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
             conn.commit()
-        return story_ids
+        return [row[0] for row in rows]
     
     def get_stories_by_research(self, research_id: str) -> List[Dict[str, Any]]:
         """Get all stories for a research ID"""
@@ -576,6 +648,20 @@ class UserStoryModel:
                 stories.append(story)
             return stories
     
+    def get_story_by_id(self, story_id: str) -> Optional[Dict[str, Any]]:
+        """Get story by story ID"""
+        with self.db._get_connection() as conn:
+            row = conn.execute("""
+                SELECT * FROM user_stories WHERE story_id = ?
+            """, (story_id,)).fetchone()
+            
+            if row:
+                story = dict(row)
+                if story['components']:
+                    story['components'] = json.loads(story['components'])
+                return story
+            return None
+    
     def get_next_pending_story(self) -> Optional[Dict[str, Any]]:
         """Get next pending story for processing"""
         with self.db._get_connection() as conn:
@@ -593,6 +679,7 @@ class UserStoryModel:
                 return story
             return None
 
+@lru_cache(maxsize=1)
 def get_user_story_model() -> UserStoryModel:
     """Get user story model instance"""
     return UserStoryModel(get_database())
@@ -659,6 +746,7 @@ class ArchitectureModel:
                 return version
             return None
 
+@lru_cache(maxsize=1)
 def get_architecture_model() -> ArchitectureModel:
     """Get architecture model instance"""
     return ArchitectureModel(get_database())
\ No newline at end of file
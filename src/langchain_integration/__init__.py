@@ -8,9 +8,11 @@ Primary interface: LangChainClient for all LLM operations
 """
 
 from .client import LangChainClient, load_env, install_dependencies, get_available_models
+from .cache import PromptCache
 
 __all__ = [
     'LangChainClient',      # Primary interface
+    'PromptCache',          # Response cache
     'load_env',            # Utility function
     'install_dependencies', # Utility function
     'get_available_models'  # Utility function
@@ -0,0 +1,67 @@
+"""
+PromptCache - Exact-match LLM response cache
+
+Stores responses in SQLite keyed by SHA-256 of provider, model and prompt, so
+re-running an identical prompt skips the remote LLM round-trip.
+
+KEY FUNCTIONS:
+- key(*parts) - Build cache key from request parts
+- get(key) - Cached response or None if missing/expired
+- put(key, response) - Store response, dropping expired entries
+"""
+
+import hashlib
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+# Repo-root data/, so the cache is shared from any cwd
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "llm_cache.db"
+
+
+class PromptCache:
+    """SQLite-backed exact-match cache for LLM responses."""
+
+    def __init__(self, db_path: str = str(DEFAULT_CACHE_PATH), ttl: int = 3600):
+        """
+        Args:
+            db_path: SQLite file for cached responses
+            ttl: Seconds before an entry expires
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(exist_ok=True)
+        self.ttl = ttl
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Build cache key from request parts"""
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get cached response, None if missing or expired"""
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            row = conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND created_at > ?",
+                (key, time.time() - self.ttl)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, response: str) -> None:
+        """Store response, dropping expired entries"""
+        now = time.time()
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute("DELETE FROM responses WHERE created_at <= ?", (now - self.ttl,))
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                (key, response, now)
+            )
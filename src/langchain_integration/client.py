@@ -18,14 +18,24 @@ KEY FUNCTIONS:
 """
 
 import os
+import re
 import sys
+import json
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from pathlib import Path
 
+from .cache import PromptCache
+
 logger = logging.getLogger(__name__)
 
 
+def _parse_json(text: str) -> Any:
+    """Parse JSON from an LLM reply, unwrapping a ```json code block if present"""
+    json_match = re.search(r'```json\n(.*?)\n```', text, re.DOTALL)
+    return json.loads(json_match.group(1) if json_match else text)
+
+
 def load_env():
     """Load environment variables from .env file."""
     env_file = Path(".env")
@@ -74,16 +84,22 @@ class LangChainClient:
     error handling and logging.
     """
     
-    def __init__(self, provider: Optional[str] = None, model: Optional[str] = None):
+    # LLM instances shared across clients so their HTTP connection pools stay warm
+    _llm_cache: Dict[tuple, Any] = {}
+    
+    def __init__(self, provider: Optional[str] = None, model: Optional[str] = None,
+                 cache: Optional[PromptCache] = None):
         """
         Initialize the LangChain client.
         
         Args:
             provider: LLM provider ("openai" or "anthropic"). Defaults to "anthropic".
             model: Specific model to use. Uses provider default if None.
+            cache: Optional PromptCache for identical prompts
         """
         self.provider = provider or "anthropic"
         self.model = model
+        self.cache = cache
         self.api_key = None
         self.llm = None
         
@@ -113,6 +129,8 @@ class LangChainClient:
     
     def _get_llm(self):
         """Get or create LLM instance."""
+        if self.llm is None:
+            self.llm = self._llm_cache.get((self.provider, self.model, self.api_key))
         if self.llm is None:
             # Temporarily remove paths that could cause module conflicts
             original_path = sys.path.copy()
@@ -145,6 +163,7 @@ class LangChainClient:
             finally:
                 # Restore original path
                 sys.path[:] = original_path
+            self._llm_cache[(self.provider, self.model, self.api_key)] = self.llm
         
         return self.llm
     
@@ -163,18 +182,7 @@ class LangChainClient:
             RuntimeError: If LLM request fails or JSON parsing fails
         """
         try:
-            response_text = self.chat(prompt, **kwargs)
-            # Extract JSON from response if wrapped in markdown
-            import json
-            import re
-            
-            # Try to find JSON in markdown code blocks
-            json_match = re.search(r'```json\n(.*?)\n```', response_text, re.DOTALL)
-            if json_match:
-                response_text = json_match.group(1)
-            
-            # Parse JSON
-            return json.loads(response_text)
+            return self._chat(prompt, None, _parse_json, **kwargs)
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
@@ -198,34 +206,27 @@ class LangChainClient:
             
         Raises:
             RuntimeError: If LLM request fails or JSON parsing fails
+            ValueError: If the prompt template lacks the "**Current Architecture:**" marker
         """
+        # Read architecture prompt template
+        prompt_file = Path("prompts/architecture_prompt.md")
+        if not prompt_file.exists():
+            raise RuntimeError("Architecture prompt template not found")
+        
+        prompt_template = prompt_file.read_text()
+        
+        # Static part (research + instructions) goes first as a cacheable system prefix,
+        # per-story part last, so repeated stories of one research reuse the cached prefix
+        static, marker, dynamic = prompt_template.partition("**Current Architecture:**")
+        if not marker:
+            raise ValueError(f"{prompt_file} is missing the '**Current Architecture:**' marker")
+        system = static.replace("{RESEARCH}", research)
+        prompt = marker + dynamic
+        prompt = prompt.replace("{CURRENT_ARCHITECTURE}", current_architecture or "None")
+        prompt = prompt.replace("{USER_STORY}", user_story)
+        
         try:
-            # Read architecture prompt template
-            from pathlib import Path
-            prompt_file = Path("prompts/architecture_prompt.md")
-            if not prompt_file.exists():
-                raise RuntimeError("Architecture prompt template not found")
-            
-            prompt_template = prompt_file.read_text()
-            
-            # Substitute placeholders
-            prompt = prompt_template.replace("{CURRENT_ARCHITECTURE}", current_architecture or "None")
-            prompt = prompt.replace("{RESEARCH}", research)
-            prompt = prompt.replace("{USER_STORY}", user_story)
-            
-            response_text = self.chat(prompt, **kwargs)
-            
-            # Extract JSON from response
-            import json
-            import re
-            
-            # Try to find JSON in markdown code blocks
-            json_match = re.search(r'```json\n(.*?)\n```', response_text, re.DOTALL)
-            if json_match:
-                response_text = json_match.group(1)
-            
-            # Parse JSON
-            return json.loads(response_text)
+            return self._chat(prompt, system, _parse_json, **kwargs)
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
@@ -234,12 +235,13 @@ class LangChainClient:
             logger.error(f"Architecture planning failed: {e}")
             raise RuntimeError(f"LLM architecture planning failed: {e}")
 
-    def chat(self, prompt: str, **kwargs) -> str:
+    def chat(self, prompt: str, system: Optional[str] = None, **kwargs) -> str:
         """
         Send a chat message and get response.
         
         Args:
             prompt: User prompt/message
+            system: Optional static system prefix, marked for provider-side prompt caching
             **kwargs: Additional parameters for the LLM
             
         Returns:
@@ -248,6 +250,31 @@ class LangChainClient:
         Raises:
             RuntimeError: If LLM request fails
         """
+        return self._chat(prompt, system, None, **kwargs)
+    
+    def _chat(self, prompt: str, system: Optional[str], parse: Optional[Callable[[str], Any]], **kwargs) -> Any:
+        """Chat through the response cache; returns parse(reply) if given, caching only replies it accepts"""
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.key(self.provider, self.model or "", repr(sorted(kwargs.items())),
+                                       system or "", prompt)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Chat response served from cache")
+                return parse(cached) if parse else cached
+        
+        content = self._invoke(prompt, system, **kwargs)
+        result = parse(content) if parse else content
+        if cache_key and isinstance(content, str):
+            # A cache failure must not fail an LLM call that succeeded
+            try:
+                self.cache.put(cache_key, content)
+            except Exception as e:
+                logger.warning("Response cache write failed: %s", e)
+        return result
+    
+    def _invoke(self, prompt: str, system: Optional[str], **kwargs) -> Any:
+        """Send messages to the LLM and return the reply content"""
         # Temporarily remove paths that could cause module conflicts
         original_path = sys.path.copy()
         project_src = str(Path(__file__).parent.parent)
@@ -258,9 +285,16 @@ class LangChainClient:
         
         try:
             llm = self._get_llm()
-            from langchain_core.messages import HumanMessage
+            from langchain_core.messages import HumanMessage, SystemMessage
             
             messages = [HumanMessage(content=prompt)]
+            if system:
+                # Anthropic needs an explicit breakpoint; OpenAI caches long prefixes automatically
+                if self.provider == "anthropic":
+                    content = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+                else:
+                    content = system
+                messages.insert(0, SystemMessage(content=content))
             response = llm.invoke(messages, **kwargs)
             return response.content
                     
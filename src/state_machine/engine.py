@@ -24,12 +24,24 @@ KEY FUNCTIONS:
 
 import asyncio
 import logging
+import sys
 import yaml
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when available, pure-Python otherwise
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Make src/ importable for dynamically loaded actions (once, not per action)
+_SRC = str(Path(__file__).parent.parent)
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+# Parsed configs keyed by (resolved path, mtime_ns)
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
 class StateMachineEngine:
     """
     Core state machine engine that loads YAML configuration and executes
@@ -48,9 +60,13 @@ class StateMachineEngine:
         config_path = Path(yaml_path)
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {yaml_path}")
-            
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        
+        key = (str(config_path.resolve()), config_path.stat().st_mtime_ns)
+        if key not in _CONFIG_CACHE:
+            with open(config_path, 'r') as f:
+                _CONFIG_CACHE[key] = yaml.load(f, Loader=_YamlLoader)
+        self.config = _CONFIG_CACHE[key]
+        self.actions = {}
             
         # Set initial state
         self.current_state = self.config.get('initial_state', 'waiting')
@@ -220,11 +236,6 @@ class StateMachineEngine:
     async def _execute_pluggable_action(self, action_type: str, action_config: Dict[str, Any]) -> None:
         """Execute pluggable action from actions module"""
         try:
-            # Import actions dynamically
-            import sys
-            from pathlib import Path
-            sys.path.insert(0, str(Path(__file__).parent.parent))
-            
             # Add queue to context for actions to use
             if hasattr(self, '_queue'):
                 self.context['queue'] = self._queue
@@ -232,39 +243,30 @@ class StateMachineEngine:
             # Add global config to context so actions can access configuration parameters
             self.context['config'] = self.config
             
-            if action_type == 'bash':
-                from actions.bash_action import BashAction
-                action = BashAction(action_config)
-                event = await action.execute(self.context)
-                await self.process_event(event)
-            elif action_type == 'check_database_queue':
-                from actions.check_database_queue_action import CheckDatabaseQueueAction
-                action = CheckDatabaseQueueAction(action_config)
-                event = await action.execute(self.context)
-                await self.process_event(event)
-            elif action_type == 'check_pony_flux_queue':
-                from actions.check_pony_flux_queue_action import CheckPonyFluxQueueAction
-                action = CheckPonyFluxQueueAction(action_config)
-                event = await action.execute(self.context)
-                await self.process_event(event)
-            elif action_type == 'sleep_action':
-                from actions.sleep_action import SleepAction
-                action = SleepAction(action_config)
-                event = await action.execute(self.context)
-                await self.process_event(event)
-            elif action_type == 'accepted_action':
-                from actions.accepted_action import AcceptedAction
-                action = AcceptedAction(action_config)
-                event = await action.execute(self.context)
-                await self.process_event(event)
-            elif action_type == 'database_record_action':
-                from actions.database_record_action import DatabaseRecordAction
-                action = DatabaseRecordAction(action_config)
-                event = await action.execute(self.context)
-                await self.process_event(event)
-            else:
-                logger.error(f"Unsupported pluggable action type: {action_type}")
-                await self.process_event('error')
+            # Reuse action instances across ticks; configs are immutable after load
+            action = self.actions.get(id(action_config))
+            if action is None:
+                if action_type == 'bash':
+                    from actions.bash_action import BashAction as action_class
+                elif action_type == 'check_database_queue':
+                    from actions.check_database_queue_action import CheckDatabaseQueueAction as action_class
+                elif action_type == 'check_pony_flux_queue':
+                    from actions.check_pony_flux_queue_action import CheckPonyFluxQueueAction as action_class
+                elif action_type == 'sleep_action':
+                    from actions.sleep_action import SleepAction as action_class
+                elif action_type == 'accepted_action':
+                    from actions.accepted_action import AcceptedAction as action_class
+                elif action_type == 'database_record_action':
+                    from actions.database_record_action import DatabaseRecordAction as action_class
+                else:
+                    logger.error(f"Unsupported pluggable action type: {action_type}")
+                    await self.process_event('error')
+                    return
+                action = action_class(action_config)
+                self.actions[id(action_config)] = action
+            
+            event = await action.execute(self.context)
+            await self.process_event(event)
                 
         except Exception as e:
             logger.error(f"Error executing pluggable action {action_type}: {e}")